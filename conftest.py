@@ -1,5 +1,26 @@
+import os
 import pytest
-from playwright.sync_api import Page, BrowserContext
+from playwright.sync_api import Page, Browser, BrowserContext, Route, expect
+from pages.page_objects import PageObjects
+from steps.login_steps import LoginSteps
+from utils.logger import Logger
+
+
+LOGIN_URL = "https://rahulshettyacademy.com/client/#/auth/login"
+DASHBOARD_URL = "https://rahulshettyacademy.com/client/#/dashboard/dash"
+
+
+# Requests aborted when --fast-network is set
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+ANALYTICS_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+)
 
 
 def pytest_addoption(parser):
@@ -15,16 +36,272 @@ def pytest_addoption(parser):
         default="https://www.google.com",
         help="Base URL to navigate to"
     )
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="Share one browser context and page across the session"
+    )
+    parser.addoption(
+        "--fast-network",
+        action="store_true",
+        default=False,
+        help="Block images, fonts, media and analytics requests"
+    )
+    parser.addoption(
+        "--auth-state",
+        action="store",
+        default=None,
+        help="Storage state file to cache the login used by authenticated_page "
+             "(the user's email is appended to the file name)"
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Flush buffered framework logs at the end of the session
+
+    Args:
+        session: Pytest session object
+        exitstatus: Exit status of the test run
+    """
+    Logger.flush()
+
+
+def _route_non_essential(route: Route) -> None:
+    """
+    Abort non-essential requests and let everything else through
+
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(domain in request.url for domain in ANALYTICS_DOMAINS)):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_non_essential_requests(context: BrowserContext) -> None:
+    """
+    Install a route on the context that blocks non-essential requests
+
+    Args:
+        context: Browser context to install the route on
+    """
+    context.route("**/*", _route_non_essential)
+
+
+@pytest.fixture(scope="session")
+def browser_context(pytestconfig, browser: Browser,
+                    browser_context_args: dict) -> BrowserContext:
+    """
+    Session-wide browser context used when --reuse-browser is set
+
+    Args:
+        pytestconfig: Pytest config object
+        browser: Browser instance
+        browser_context_args: Context arguments from pytest-playwright
+
+    Returns:
+        BrowserContext: Shared browser context
+    """
+    context = browser.new_context(**browser_context_args)
+    if pytestconfig.getoption("--fast-network"):
+        block_non_essential_requests(context)
+
+    yield context
+
+    # Cleanup
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def shared_page(browser_context: BrowserContext) -> Page:
+    """
+    Session-wide page used when --reuse-browser is set
+
+    Args:
+        browser_context: Shared browser context
+
+    Returns:
+        Page: Shared Playwright page instance
+    """
+    page = browser_context.new_page()
+
+    yield page
+
+    # Cleanup
+    page.close()
+
+
+@pytest.fixture(scope="session")
+def creds() -> dict:
+    """
+    Credentials of the test user
+
+    Shared by tests (login_steps.perform_login(**creds)) and by
+    auth_state_file, so the cached login always matches the test user.
+
+    Returns:
+        dict: Email and password
+    """
+    return {"email": "atulmysuru@gmail.com", "password": "India123#"}
+
+
+@pytest.fixture(scope="session")
+def auth_state_file(pytestconfig, tmp_path_factory, worker_id: str, browser: Browser,
+                    browser_context_args: dict, creds: dict) -> str:
+    """
+    Log in once and return the path of the saved storage state
+
+    Logs in once per session (per worker under xdist). With --auth-state
+    the storage state is saved next to that path and reused by later runs
+    until the file is deleted, otherwise it lives in a session temp
+    directory. The file name is keyed on the user's email (e.g.
+    .auth/storage_state.json -> .auth/storage_state_<email>.json), so a
+    change of credentials never reuses another user's session.
+
+    Args:
+        pytestconfig: Pytest config object
+        tmp_path_factory: Pytest temp directory factory
+        worker_id: pytest-xdist worker id ("master" when not distributed)
+        browser: Browser instance
+        browser_context_args: Context arguments from pytest-playwright
+        creds: Credentials of the test user
+
+    Returns:
+        str: Path to the storage state file
+    """
+    base_path = pytestconfig.getoption("--auth-state")
+    if not base_path:
+        base_path = str(tmp_path_factory.mktemp("auth") / "auth.json")
+    root, ext = os.path.splitext(base_path)
+    state_path = f"{root}_{creds['email']}{ext}"
+
+    if os.path.exists(state_path):
+        return state_path
+
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    login_steps = LoginSteps(page)
+    login_steps.navigate_to_login_page(LOGIN_URL)
+    login_steps.perform_login(creds["email"], creds["password"])
+
+    # Write per worker and swap in atomically so parallel workers
+    # never read a partially written file
+    os.makedirs(os.path.dirname(os.path.abspath(state_path)), exist_ok=True)
+    tmp_path = f"{state_path}.{worker_id}"
+    context.storage_state(path=tmp_path)
+    os.replace(tmp_path, state_path)
+
+    # Cleanup
+    context.close()
+
+    return state_path
+
+
+@pytest.fixture(scope="module")
+def authenticated_context(pytestconfig, browser: Browser, browser_context_args: dict,
+                          auth_state_file: str) -> BrowserContext:
+    """
+    Logged-in browser context shared by the tests of a module
+
+    Args:
+        pytestconfig: Pytest config object
+        browser: Browser instance
+        browser_context_args: Context arguments from pytest-playwright
+        auth_state_file: Path to the saved storage state
+
+    Returns:
+        BrowserContext: Authenticated browser context
+    """
+    context = browser.new_context(**browser_context_args, storage_state=auth_state_file)
+    if pytestconfig.getoption("--fast-network"):
+        block_non_essential_requests(context)
+
+    yield context
+
+    # Cleanup
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def authenticated_page(request, authenticated_context: BrowserContext,
+                       auth_state_file: str) -> Page:
+    """
+    Logged-in page that starts on the dashboard
+
+    Each test gets its own page in the module's shared logged-in context,
+    so the context and its storage state are not rebuilt per test.
+
+    Navigating to the dashboard URL succeeds even with an expired session,
+    so the fixture waits for the Sign Out button before handing out the page.
+
+    Args:
+        request: Pytest request object
+        authenticated_context: Authenticated browser context
+        auth_state_file: Path to the saved storage state
+
+    Returns:
+        Page: Playwright page instance
+    """
+    # Allow tests to override how long the initial navigation waits
+    marker = request.node.get_closest_marker("goto_wait_until")
+    wait_until = marker.args[0] if marker else "domcontentloaded"
+
+    page = authenticated_context.new_page()
+    page.goto(DASHBOARD_URL, wait_until=wait_until)
+
+    try:
+        expect(page.get_by_role("button", name="Sign Out")).to_be_visible()
+    except AssertionError:
+        page.close()
+        pytest.fail(
+            f"Cached login is not valid; delete {auth_state_file} and re-run",
+            pytrace=False
+        )
+
+    yield page
+
+    # Cleanup
+    page.close()
+
+
+def reset_page(page: Page, url: str, wait_until: str = "domcontentloaded") -> None:
+    """
+    Reset a reused page to a clean state and navigate to URL
+
+    Args:
+        page: Playwright page instance
+        url: URL to navigate to
+        wait_until: Load state to wait for after navigation
+    """
+    page.context.clear_cookies()
+    # Storage is not accessible on about:blank, so ignore failures there
+    page.evaluate(
+        "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+    )
+    page.goto(url, wait_until=wait_until)
 
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_page(request, context: BrowserContext) -> Page:
+@pytest.fixture(scope="function")
+def setup_page(request) -> Page:
     """
     Initialize page and navigate to URL from CLI args
 
+    Not autouse: UI tests request it explicitly so non-UI tests never
+    open a browser page.
+
+    With --reuse-browser the session-wide page is reset and reused,
+    otherwise a new page is opened in a per-test context.
+
+    Navigation waits for DOMContentLoaded only and relies on locator
+    auto-waiting; use @pytest.mark.goto_wait_until("load") to override.
+
     Args:
         request: Pytest request object
-        context: Browser context
 
     Returns:
         Page: Playwright page instance
@@ -32,13 +309,62 @@ def setup_page(request, context: BrowserContext) -> Page:
     # Get URL from CLI args
     url = request.config.getoption("--url")
 
+    # Allow tests to override how long the initial navigation waits
+    marker = request.node.get_closest_marker("goto_wait_until")
+    wait_until = marker.args[0] if marker else "domcontentloaded"
+
+    if request.config.getoption("--reuse-browser"):
+        page = request.getfixturevalue("shared_page")
+        reset_page(page, url, wait_until)
+        yield page
+        return
+
     # Create new page
+    context = request.getfixturevalue("context")
+    if request.config.getoption("--fast-network"):
+        block_non_essential_requests(context)
     page = context.new_page()
 
     # Navigate to URL
-    page.goto(url)
+    page.goto(url, wait_until=wait_until)
 
     yield page
 
     # Cleanup
     page.close()
+
+
+@pytest.fixture(scope="session")
+def shared_page_objects(shared_page: Page) -> PageObjects:
+    """
+    Page objects for the session-wide page used with --reuse-browser
+
+    Args:
+        shared_page: Shared Playwright page instance
+
+    Returns:
+        PageObjects: Page objects bound to the shared page
+    """
+    return PageObjects(shared_page)
+
+
+@pytest.fixture(scope="function")
+def pages(request, setup_page: Page) -> PageObjects:
+    """
+    Page objects for the test's page
+
+    With --reuse-browser the same instances are handed to every test
+    running on the shared page instead of being rebuilt per test.
+
+    Args:
+        request: Pytest request object
+        setup_page: Playwright page instance
+
+    Returns:
+        PageObjects: Page objects bound to setup_page
+    """
+    if request.config.getoption("--reuse-browser"):
+        shared = request.getfixturevalue("shared_page_objects")
+        if shared.page is setup_page:
+            return shared
+    return PageObjects(setup_page)
@@ -1,5 +1,5 @@
-from playwright.sync_api import Page, Locator, expect
-from typing import Optional, List
+from playwright.sync_api import Page, Locator, expect, Error as PlaywrightError
+from typing import Callable, Optional, List, Dict
 from utils.logger import Logger
 
 
@@ -16,17 +16,22 @@ class BasePage:
         self.page = page
         self.logger = Logger.get_logger(self.__class__.__name__)
         self.timeout = 30000
+        self._locator_cache: Dict[str, Locator] = {}
 
     def navigate(self, url: str) -> None:
         """
         Navigate to a URL
 
+        Waits for DOMContentLoaded only; element actions auto-wait for
+        actionability, so there is no need to block on the full load event.
+
         Args:
             url: URL to navigate to
         """
-        self.logger.info(f"Navigating to URL: {url}")
+        self.logger.info("Navigating to URL: %s", url)
+        self._locator_cache.clear()
         self.page.goto(url, wait_until="domcontentloaded")
-        self.logger.info(f"Successfully navigated to: {url}")
+        self.logger.info("Successfully navigated to: %s", url)
 
     def click(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
         """
@@ -38,9 +43,9 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Clicking on element: {locator}")
+        self.logger.info("Clicking on element: %s", locator)
         element.click(timeout=timeout)
-        self.logger.debug(f"Clicked on element: {locator}")
+        self.logger.debug("Clicked on element: %s", locator)
 
     def double_click(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
         """
@@ -52,7 +57,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Double clicking on element: {locator}")
+        self.logger.info("Double clicking on element: %s", locator)
         element.dblclick(timeout=timeout)
 
     def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = None) -> None:
@@ -66,24 +71,25 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Filling text '{text}' into element: {locator}")
+        self.logger.info("Filling text '%s' into element: %s", text, locator)
         element.fill(text, timeout=timeout)
-        self.logger.debug(f"Filled text into element: {locator}")
+        self.logger.debug("Filled text into element: %s", locator)
 
-    def type_text(self, locator: str | Locator, text: str, delay: int = 100,
+    def type_text(self, locator: str | Locator, text: str, delay: int = 0,
                   timeout: Optional[int] = None) -> None:
         """
-        Type text with delay (simulates human typing)
+        Type text key by key (prefer fill() unless keystroke events are needed)
 
         Args:
             locator: Element locator
             text: Text to type
-            delay: Delay between keystrokes in milliseconds
+            delay: Delay between keystrokes in milliseconds; only set this for
+                inputs that throttle or debounce per-key handlers
             timeout: Optional timeout in milliseconds
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Typing text '{text}' into element: {locator}")
+        self.logger.info("Typing text '%s' into element: %s", text, locator)
         element.type(text, delay=delay, timeout=timeout)
 
     def clear(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
@@ -96,7 +102,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Clearing element: {locator}")
+        self.logger.info("Clearing element: %s", locator)
         element.clear(timeout=timeout)
 
     def select_option(self, locator: str | Locator, value: str,
@@ -111,7 +117,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Selecting option '{value}' from dropdown: {locator}")
+        self.logger.info("Selecting option '%s' from dropdown: %s", value, locator)
         element.select_option(value, timeout=timeout)
 
     def check(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
@@ -124,7 +130,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Checking checkbox: {locator}")
+        self.logger.info("Checking checkbox: %s", locator)
         element.check(timeout=timeout)
 
     def uncheck(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
@@ -137,7 +143,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Unchecking checkbox: {locator}")
+        self.logger.info("Unchecking checkbox: %s", locator)
         element.uncheck(timeout=timeout)
 
     def hover(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
@@ -150,7 +156,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         element = self._get_element(locator)
-        self.logger.info(f"Hovering over element: {locator}")
+        self.logger.info("Hovering over element: %s", locator)
         element.hover(timeout=timeout)
 
     def press_key(self, key: str) -> None:
@@ -160,7 +166,7 @@ class BasePage:
         Args:
             key: Key to press (e.g., 'Enter', 'Escape', 'Tab')
         """
-        self.logger.info(f"Pressing key: {key}")
+        self.logger.info("Pressing key: %s", key)
         self.page.keyboard.press(key)
 
     def get_text(self, locator: str | Locator, timeout: Optional[int] = None) -> str:
@@ -177,7 +183,7 @@ class BasePage:
         timeout = timeout or self.timeout
         element = self._get_element(locator)
         text = element.text_content(timeout=timeout)
-        self.logger.debug(f"Retrieved text '{text}' from element: {locator}")
+        self.logger.debug("Retrieved text '%s' from element: %s", text, locator)
         return text or ""
 
     def get_attribute(self, locator: str | Locator, attribute: str,
@@ -196,13 +202,16 @@ class BasePage:
         timeout = timeout or self.timeout
         element = self._get_element(locator)
         value = element.get_attribute(attribute, timeout=timeout)
-        self.logger.debug(f"Retrieved attribute '{attribute}' = '{value}' from element: {locator}")
+        self.logger.debug("Retrieved attribute '%s' = '%s' from element: %s", attribute, value, locator)
         return value
 
     def is_visible(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
         """
         Check if element is visible
 
+        Checks the current DOM immediately unless a timeout is given, in
+        which case it waits up to that long for the element to appear.
+
         Args:
             locator: Element locator
             timeout: Optional timeout in milliseconds
@@ -210,11 +219,13 @@ class BasePage:
         Returns:
             bool: True if visible, False otherwise
         """
-        timeout = timeout or self.timeout
+        element = self._get_element(locator)
         try:
-            element = self._get_element(locator)
-            return element.is_visible(timeout=timeout)
-        except Exception:
+            if not timeout:
+                return element.is_visible()
+            element.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightError:
             return False
 
     def is_enabled(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
@@ -256,7 +267,7 @@ class BasePage:
             timeout: Optional timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        self.logger.info(f"Waiting for selector '{locator}' to be {state}")
+        self.logger.info("Waiting for selector '%s' to be %s", locator, state)
         self.page.wait_for_selector(locator, state=state, timeout=timeout)
 
     def wait_for_url(self, url: str, timeout: Optional[int] = None) -> None:
@@ -268,7 +279,7 @@ class BasePage:
             timeout: Optional timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        self.logger.info(f"Waiting for URL to match: {url}")
+        self.logger.info("Waiting for URL to match: %s", url)
         self.page.wait_for_url(url, timeout=timeout)
 
     def wait_for_load_state(self, state: str = "load", timeout: Optional[int] = None) -> None:
@@ -280,7 +291,7 @@ class BasePage:
             timeout: Optional timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        self.logger.info(f"Waiting for load state: {state}")
+        self.logger.info("Waiting for load state: %s", state)
         self.page.wait_for_load_state(state, timeout=timeout)
 
     def get_current_url(self) -> str:
@@ -291,7 +302,7 @@ class BasePage:
             str: Current URL
         """
         url = self.page.url
-        self.logger.debug(f"Current URL: {url}")
+        self.logger.debug("Current URL: %s", url)
         return url
 
     def get_title(self) -> str:
@@ -302,7 +313,7 @@ class BasePage:
             str: Page title
         """
         title = self.page.title()
-        self.logger.debug(f"Page title: {title}")
+        self.logger.debug("Page title: %s", title)
         return title
 
     def screenshot(self, path: str, full_page: bool = False) -> None:
@@ -313,22 +324,25 @@ class BasePage:
             path: Path to save screenshot
             full_page: Whether to capture full page
         """
-        self.logger.info(f"Taking screenshot: {path}")
+        self.logger.info("Taking screenshot: %s", path)
         self.page.screenshot(path=path, full_page=full_page)
 
     def reload(self) -> None:
         """Reload the current page"""
         self.logger.info("Reloading page")
+        self._locator_cache.clear()
         self.page.reload()
 
     def go_back(self) -> None:
         """Navigate back in history"""
         self.logger.info("Navigating back")
+        self._locator_cache.clear()
         self.page.go_back()
 
     def go_forward(self) -> None:
         """Navigate forward in history"""
         self.logger.info("Navigating forward")
+        self._locator_cache.clear()
         self.page.go_forward()
 
     def get_elements(self, locator: str) -> List[Locator]:
@@ -342,7 +356,7 @@ class BasePage:
             List of Locator objects
         """
         elements = self.page.locator(locator).all()
-        self.logger.debug(f"Found {len(elements)} elements for locator: {locator}")
+        self.logger.debug("Found %d elements for locator: %s", len(elements), locator)
         return elements
 
     def scroll_to_element(self, locator: str | Locator) -> None:
@@ -353,13 +367,15 @@ class BasePage:
             locator: Element locator
         """
         element = self._get_element(locator)
-        self.logger.info(f"Scrolling to element: {locator}")
+        self.logger.info("Scrolling to element: %s", locator)
         element.scroll_into_view_if_needed()
 
     def _get_element(self, locator: str | Locator) -> Locator:
         """
         Get Locator object from string or Locator
 
+        String locators are cached so repeated lookups reuse the same Locator.
+
         Args:
             locator: Element locator (string or Locator object)
 
@@ -367,9 +383,29 @@ class BasePage:
             Locator: Playwright Locator object
         """
         if isinstance(locator, str):
-            return self.page.locator(locator)
+            element = self._locator_cache.get(locator)
+            if element is None:
+                element = self.page.locator(locator)
+                self._locator_cache[locator] = element
+            return element
         return locator
 
+    def _assert(self, check: Callable[[], None], assertion_msg: str) -> None:
+        """
+        Run an expect() check and log its result
+
+        Args:
+            check: Callable performing the expect() assertion
+            assertion_msg: Description of what is being asserted
+        """
+        self.logger.info("Asserting: %s", assertion_msg)
+        try:
+            check()
+        except AssertionError:
+            Logger.log_assertion(self.logger, assertion_msg, False)
+            raise
+        Logger.log_assertion(self.logger, assertion_msg, True)
+
     def assert_element_visible(self, locator: str | Locator,
                               message: Optional[str] = None) -> None:
         """
@@ -381,13 +417,7 @@ class BasePage:
         """
         element = self._get_element(locator)
         assertion_msg = message or f"Element {locator} should be visible"
-        self.logger.info(f"Asserting: {assertion_msg}")
-        try:
-            expect(element).to_be_visible()
-            Logger.log_assertion(self.logger, assertion_msg, True)
-        except AssertionError as e:
-            Logger.log_assertion(self.logger, assertion_msg, False)
-            raise e
+        self._assert(lambda: expect(element).to_be_visible(), assertion_msg)
 
     def assert_element_hidden(self, locator: str | Locator,
                              message: Optional[str] = None) -> None:
@@ -400,13 +430,7 @@ class BasePage:
         """
         element = self._get_element(locator)
         assertion_msg = message or f"Element {locator} should be hidden"
-        self.logger.info(f"Asserting: {assertion_msg}")
-        try:
-            expect(element).to_be_hidden()
-            Logger.log_assertion(self.logger, assertion_msg, True)
-        except AssertionError as e:
-            Logger.log_assertion(self.logger, assertion_msg, False)
-            raise e
+        self._assert(lambda: expect(element).to_be_hidden(), assertion_msg)
 
     def assert_text(self, locator: str | Locator, expected_text: str,
                    message: Optional[str] = None) -> None:
@@ -420,13 +444,7 @@ class BasePage:
         """
         element = self._get_element(locator)
         assertion_msg = message or f"Element {locator} should contain text '{expected_text}'"
-        self.logger.info(f"Asserting: {assertion_msg}")
-        try:
-            expect(element).to_have_text(expected_text)
-            Logger.log_assertion(self.logger, assertion_msg, True)
-        except AssertionError as e:
-            Logger.log_assertion(self.logger, assertion_msg, False)
-            raise e
+        self._assert(lambda: expect(element).to_have_text(expected_text), assertion_msg)
 
     def assert_url(self, expected_url: str, message: Optional[str] = None) -> None:
         """
@@ -437,13 +455,7 @@ class BasePage:
             message: Optional custom assertion message
         """
         assertion_msg = message or f"URL should match '{expected_url}'"
-        self.logger.info(f"Asserting: {assertion_msg}")
-        try:
-            expect(self.page).to_have_url(expected_url)
-            Logger.log_assertion(self.logger, assertion_msg, True)
-        except AssertionError as e:
-            Logger.log_assertion(self.logger, assertion_msg, False)
-            raise e
+        self._assert(lambda: expect(self.page).to_have_url(expected_url), assertion_msg)
 
     def assert_title(self, expected_title: str, message: Optional[str] = None) -> None:
         """
@@ -454,10 +466,4 @@ class BasePage:
             message: Optional custom assertion message
         """
         assertion_msg = message or f"Page title should be '{expected_title}'"
-        self.logger.info(f"Asserting: {assertion_msg}")
-        try:
-            expect(self.page).to_have_title(expected_title)
-            Logger.log_assertion(self.logger, assertion_msg, True)
-        except AssertionError as e:
-            Logger.log_assertion(self.logger, assertion_msg, False)
-            raise e
+        self._assert(lambda: expect(self.page).to_have_title(expected_title), assertion_msg)
@@ -1,6 +1,5 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
-from typing import Optional
 
 
 class LoginPage(BasePage):
@@ -17,14 +16,14 @@ class LoginPage(BasePage):
 
         # Define locators using preferred strategies (role > test-id > CSS)
         # Using role-based locators discovered from browser exploration
-        self.email_input = "role=textbox[name='email@example.com']"
-        self.password_input = "role=textbox[name='enter your passsword']"
-        self.login_button = "role=button[name='Login']"
-        self.forgot_password_link = "role=link[name='Forgot password?']"
-        self.register_link = "role=link[name='Register']"
+        self.email_input = page.get_by_role("textbox", name="email@example.com")
+        self.password_input = page.get_by_role("textbox", name="enter your passsword")
+        self.login_button = page.get_by_role("button", name="Login")
+        self.forgot_password_link = page.get_by_role("link", name="Forgot password?")
+        self.register_link = page.get_by_role("link", name="Register")
 
         # Success message locator
-        self.success_message = "role=generic[name='Login Successfully']"
+        self.success_message = page.get_by_role("generic", name="Login Successfully")
 
     def enter_email(self, email: str) -> None:
         """
@@ -33,7 +32,7 @@ class LoginPage(BasePage):
         Args:
             email: Email address to enter
         """
-        self.logger.info(f"Entering email: {email}")
+        self.logger.info("Entering email: %s", email)
         self.fill(self.email_input, email)
 
     def enter_password(self, password: str) -> None:
@@ -50,8 +49,6 @@ class LoginPage(BasePage):
         """Click the login button"""
         self.logger.info("Clicking login button")
         self.click(self.login_button)
-        # Wait for navigation to complete
-        self.wait_for_load_state("networkidle")
 
     def login(self, email: str, password: str) -> None:
         """
@@ -61,22 +58,11 @@ class LoginPage(BasePage):
             email: Email address
             password: Password
         """
-        self.logger.info(f"Performing login with email: {email}")
+        self.logger.info("Performing login with email: %s", email)
         self.enter_email(email)
         self.enter_password(password)
         self.click_login_button()
 
-    def wait_for_login_success(self, timeout: Optional[int] = None) -> None:
-        """
-        Wait for successful login (URL change to dashboard)
-
-        Args:
-            timeout: Optional timeout in milliseconds
-        """
-        self.logger.info("Waiting for successful login")
-        self.page.wait_for_url("**/dashboard/dash", timeout=timeout or self.timeout)
-        self.logger.info("Successfully navigated to dashboard")
-
     def is_on_login_page(self) -> bool:
         """
         Check if currently on login page
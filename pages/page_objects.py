@@ -0,0 +1,27 @@
+from functools import cached_property
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+
+
+class PageObjects:
+    """Lazily created page objects bound to a single Playwright page"""
+
+    def __init__(self, page: Page):
+        """
+        Initialize PageObjects
+
+        Args:
+            page: Playwright page instance
+        """
+        self.page = page
+
+    @cached_property
+    def login(self) -> LoginPage:
+        """LoginPage bound to this page"""
+        return LoginPage(self.page)
+
+    @cached_property
+    def products(self) -> ProductsPage:
+        """ProductsPage bound to this page"""
+        return ProductsPage(self.page)
@@ -1,4 +1,5 @@
-from playwright.sync_api import Page
+import re
+from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 from typing import List, Optional
 
@@ -16,15 +17,15 @@ class ProductsPage(BasePage):
         super().__init__(page)
 
         # Navigation locators
-        self.home_button = "role=button[name=' HOME']"
-        self.orders_button = "role=button[name=' ORDERS']"
-        self.cart_button = "role=button[name=' Cart']"
-        self.signout_button = "role=button[name='Sign Out']"
+        self.home_button = page.get_by_role("button", name=" HOME")
+        self.orders_button = page.get_by_role("button", name=" ORDERS")
+        self.cart_button = page.get_by_role("button", name=" Cart")
+        self.signout_button = page.get_by_role("button", name="Sign Out")
 
         # Search and filter locators
-        self.search_input = "role=textbox[name='search']"
-        self.min_price_input = "role=textbox[name='Min Price']"
-        self.max_price_input = "role=textbox[name='Max Price']"
+        self.search_input = page.get_by_role("textbox", name="search")
+        self.min_price_input = page.get_by_role("textbox", name="Min Price")
+        self.max_price_input = page.get_by_role("textbox", name="Max Price")
 
         # Product card locators
         self.product_cards = ".card-body"
@@ -36,6 +37,9 @@ class ProductsPage(BasePage):
         # Results info
         self.results_count = "div:has-text('Showing') >> nth=0"
 
+        # Backend endpoint that serves product search results
+        self.products_api = "/api/ecom/product/get-all-products"
+
     def click_search_box(self) -> None:
         """Click on the search input box"""
         self.logger.info("Clicking search box")
@@ -48,15 +52,39 @@ class ProductsPage(BasePage):
         Args:
             search_text: Text to search for
         """
-        self.logger.info(f"Entering search text: {search_text}")
+        self.logger.info("Entering search text: %s", search_text)
         self.fill(self.search_input, search_text)
 
-    def press_enter_in_search(self) -> None:
-        """Press Enter key to trigger search"""
+    def press_enter_in_search(self, search_text: str) -> None:
+        """
+        Press Enter key to trigger search
+
+        Returns once the rendered product cards match the search response,
+        so reads that do not auto-wait (counts, text contents) see the
+        new results rather than the pre-search cards.
+
+        Args:
+            search_text: Text typed into the search box, used to tell the
+                search request apart from the dashboard's initial product list
+        """
         self.logger.info("Pressing Enter to trigger search")
-        self.press_key("Enter")
-        # Wait for search results to load
-        self.wait_for_load_state('networkidle')
+
+        def is_search_response(response) -> bool:
+            request = response.request
+            return (self.products_api in response.url
+                    and request.method == "POST"
+                    and search_text in (request.post_data or ""))
+
+        # Wait for the search response instead of network idle
+        with self.page.expect_response(is_search_response, timeout=self.timeout) as response_info:
+            self.press_key("Enter")
+
+        # The response arrives before the cards re-render; wait for the DOM
+        expected_count = len(response_info.value.json().get("data") or [])
+        self.logger.debug("Search response returned %d products", expected_count)
+        expect(self.page.locator(self.product_cards)).to_have_count(
+            expected_count, timeout=self.timeout
+        )
 
     def search_product(self, product_name: str) -> None:
         """
@@ -65,11 +93,11 @@ class ProductsPage(BasePage):
         Args:
             product_name: Name of the product to search
         """
-        self.logger.info(f"Searching for product: {product_name}")
+        self.logger.info("Searching for product: %s", product_name)
         self.click_search_box()
         self.enter_search_text(product_name)
-        self.press_enter_in_search()
-        self.logger.info(f"Search completed for: {product_name}")
+        self.press_enter_in_search(product_name)
+        self.logger.info("Search completed for: %s", product_name)
 
     def get_all_product_names(self) -> List[str]:
         """
@@ -79,9 +107,11 @@ class ProductsPage(BasePage):
             List[str]: List of product names
         """
         self.logger.info("Retrieving all product names")
-        product_elements = self.get_elements(self.product_names)
-        product_names = [element.text_content() for element in product_elements]
-        self.logger.info(f"Found {len(product_names)} products: {product_names}")
+        product_names = [
+            name.strip()
+            for name in self.page.locator(self.product_names).all_text_contents()
+        ]
+        self.logger.info("Found %d products: %s", len(product_names), product_names)
         return product_names
 
     def get_product_count(self) -> int:
@@ -91,43 +121,37 @@ class ProductsPage(BasePage):
         Returns:
             int: Number of visible products
         """
-        product_elements = self.get_elements(self.product_cards)
-        count = len(product_elements)
-        self.logger.info(f"Product count: {count}")
+        count = self.page.locator(self.product_cards).count()
+        self.logger.info("Product count: %d", count)
         return count
 
     def verify_all_products_contain(self, keyword: str) -> bool:
         """
         Verify that all product names contain the specified keyword
 
+        Counts the product names missing the keyword (case-insensitive) in
+        the browser instead of fetching every name.
+
         Args:
             keyword: Keyword to check in product names
 
         Returns:
             bool: True if all products contain keyword, False otherwise
         """
-        self.logger.info(f"Verifying all products contain keyword: {keyword}")
-        product_names = self.get_all_product_names()
+        self.logger.info("Verifying all products contain keyword: %s", keyword)
+        product_names = self.page.locator(self.product_names)
 
-        if not product_names:
+        count = product_names.count()
+        if not count:
             self.logger.warning("No products found")
             return False
 
-        # Check each product name (case-insensitive)
-        keyword_lower = keyword.lower()
-        products_without_keyword = []
-
-        for product_name in product_names:
-            if keyword_lower not in product_name.lower():
-                products_without_keyword.append(product_name)
-
-        if products_without_keyword:
-            self.logger.error(
-                f"Products not containing '{keyword}': {products_without_keyword}"
-            )
+        missing = product_names.filter(has_not_text=keyword).count()
+        if missing:
+            self.logger.error("%d of %d products do not contain '%s'", missing, count, keyword)
             return False
 
-        self.logger.info(f"All {len(product_names)} products contain '{keyword}'")
+        self.logger.info("All %d products contain '%s'", count, keyword)
         return True
 
     def get_results_count_text(self) -> str:
@@ -138,9 +162,24 @@ class ProductsPage(BasePage):
             str: Results count text (e.g., "Showing 1 results |")
         """
         text = self.get_text(self.results_count)
-        self.logger.debug(f"Results count text: {text}")
+        self.logger.debug("Results count text: %s", text)
         return text
 
+    def wait_for_products_loaded(self) -> None:
+        """
+        Wait for the dashboard to render its product list
+
+        The results text and product cards render after the dashboard URL
+        changes, so reads that do not auto-wait must call this first.
+        """
+        self.logger.info("Waiting for products to load")
+        expect(self.page.locator(self.results_count)).to_have_text(
+            re.compile(r"Showing\s+\d+"), timeout=self.timeout
+        )
+        expect(self.page.locator(self.product_cards).first).to_be_visible(
+            timeout=self.timeout
+        )
+
     def add_product_to_cart_by_name(self, product_name: str) -> None:
         """
         Add a product to cart by its name
@@ -148,12 +187,15 @@ class ProductsPage(BasePage):
         Args:
             product_name: Name of the product to add to cart
         """
-        self.logger.info(f"Adding product '{product_name}' to cart")
-        # Locate the product card containing the product name, then find Add to Cart button
-        product_card_locator = f"h5:has-text('{product_name}') >> xpath=ancestor::div[contains(@class, 'card-body')]"
-        add_to_cart_button = f"{product_card_locator} >> button:has-text('Add To Cart')"
+        self.logger.info("Adding product '%s' to cart", product_name)
+        # Filter product cards by their title, then find Add to Cart button
+        add_to_cart_button = (
+            self.page.locator(self.product_cards)
+            .filter(has=self.page.locator("h5", has_text=product_name))
+            .get_by_role("button", name="Add To Cart")
+        )
         self.click(add_to_cart_button)
-        self.logger.info(f"Product '{product_name}' added to cart")
+        self.logger.info("Product '%s' added to cart", product_name)
 
     def is_on_products_page(self) -> bool:
         """
@@ -168,4 +210,4 @@ class ProductsPage(BasePage):
         """Click sign out button"""
         self.logger.info("Clicking sign out button")
         self.click(self.signout_button)
-        self.wait_for_load_state('networkidle')
+        self.wait_for_url("**/auth/login")
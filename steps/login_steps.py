@@ -1,11 +1,23 @@
-from playwright.sync_api import Page
+import re
+from functools import cached_property
+from playwright.sync_api import Page, expect
 from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
 from utils.logger import Logger
 
 
+# URL fragment of the page users land on after logging in
+_DASHBOARD_RE = re.compile(r"/dashboard/dash")
+
+# Number in the dashboard's "Showing N results" text
+_RESULTS_COUNT_RE = re.compile(r"Showing\s+(\d+)")
+
+
 class LoginSteps:
     """Step file containing login-related business logic"""
 
+    logger = Logger.get_logger(__name__)
+
     def __init__(self, page: Page):
         """
         Initialize LoginSteps
@@ -14,8 +26,16 @@ class LoginSteps:
             page: Playwright page instance
         """
         self.page = page
-        self.login_page = LoginPage(page)
-        self.logger = Logger.get_logger(__name__)
+
+    @cached_property
+    def login_page(self) -> LoginPage:
+        """LoginPage for this page, created on first use"""
+        return LoginPage(self.page)
+
+    @cached_property
+    def products_page(self) -> ProductsPage:
+        """ProductsPage for the dashboard reached after login, created on first use"""
+        return ProductsPage(self.page)
 
     def navigate_to_login_page(self, url: str) -> None:
         """
@@ -42,7 +62,7 @@ class LoginSteps:
         self.login_page.login(email, password)
 
         # Wait for successful login (navigation to dashboard)
-        self.login_page.wait_for_login_success()
+        expect(self.page).to_have_url(_DASHBOARD_RE, timeout=10_000)
 
         self.logger.info("Login workflow completed successfully")
 
@@ -50,13 +70,18 @@ class LoginSteps:
         """
         Verify that login was successful by checking URL
 
+        Checks the current URL without waiting, so call it after
+        perform_login(), which waits for the redirect to the dashboard.
+        The URL alone does not prove a valid session after navigating to
+        the dashboard directly; use ProductsPage.is_on_products_page() there.
+
         Returns:
             bool: True if login successful, False otherwise
         """
         Logger.log_step(self.logger, "Verifying login success")
 
         current_url = self.page.url
-        is_successful = "/dashboard/dash" in current_url
+        is_successful = bool(_DASHBOARD_RE.search(current_url))
 
         if is_successful:
             Logger.log_assertion(
@@ -84,3 +109,28 @@ class LoginSteps:
         Logger.log_step(self.logger, f"Starting login flow for user: {email}")
         self.perform_login(email, password)
         self.verify_login_success()
+
+    def get_displayed_results_count(self) -> int:
+        """
+        Get the number shown in the dashboard's "Showing N results" text
+
+        Waits for the product list to render first, so it can be called
+        right after perform_login.
+
+        Returns:
+            int: Displayed number of results
+
+        Raises:
+            ValueError: If the results text does not contain a count
+        """
+        Logger.log_step(self.logger, "Reading displayed results count")
+        self.products_page.wait_for_products_loaded()
+
+        text = self.products_page.get_results_count_text()
+        match = _RESULTS_COUNT_RE.search(text)
+        if not match:
+            raise ValueError(f"No results count found in text: {text!r}")
+
+        count = int(match.group(1))
+        self.logger.info("Displayed results count: %d", count)
+        return count
@@ -1,12 +1,15 @@
+from functools import cached_property
 from playwright.sync_api import Page
 from pages.products_page import ProductsPage
 from utils.logger import Logger
-from typing import List
+from typing import Callable, List, Tuple
 
 
 class SearchSteps:
     """Step file containing search-related business logic"""
 
+    logger = Logger.get_logger(__name__)
+
     def __init__(self, page: Page):
         """
         Initialize SearchSteps
@@ -15,8 +18,11 @@ class SearchSteps:
             page: Playwright page instance
         """
         self.page = page
-        self.products_page = ProductsPage(page)
-        self.logger = Logger.get_logger(__name__)
+
+    @cached_property
+    def products_page(self) -> ProductsPage:
+        """ProductsPage for this page, created on first use"""
+        return ProductsPage(self.page)
 
     def search_for_product(self, product_name: str) -> None:
         """
@@ -30,7 +36,7 @@ class SearchSteps:
         # Perform search using ProductsPage
         self.products_page.search_product(product_name)
 
-        self.logger.info(f"Search workflow completed for: {product_name}")
+        self.logger.info("Search workflow completed for: %s", product_name)
 
     def get_all_product_names(self) -> List[str]:
         """
@@ -43,25 +49,66 @@ class SearchSteps:
 
         product_names = self.products_page.get_all_product_names()
 
-        self.logger.info(f"Retrieved {len(product_names)} product names: {product_names}")
+        self.logger.info("Retrieved %d product names: %s", len(product_names), product_names)
         return product_names
 
+    def verify_all_contain(self, keyword: str) -> Tuple[bool, List[str]]:
+        """
+        Verify that all search results contain the keyword using a single
+        fetch of the product names
+
+        Args:
+            keyword: Keyword to verify in product names
+
+        Returns:
+            Tuple[bool, List[str]]: Whether all products contain the keyword
+            (False if there are no products) and the product names
+        """
+        product_names = self.products_page.get_all_product_names()
+        keyword_lower = keyword.lower()
+        result = self._verify_keyword(
+            keyword,
+            lambda: bool(product_names) and all(
+                keyword_lower in name.lower() for name in product_names
+            )
+        )
+        return result, product_names
+
     def verify_all_products_contain_keyword(self, keyword: str) -> bool:
         """
         Verify that all search results contain the specified keyword
 
+        Uses a count query in the browser rather than fetching the names;
+        use verify_all_contain() when the names are needed as well.
+
         Args:
             keyword: Keyword to verify in product names
 
         Returns:
             bool: True if all products contain keyword, False otherwise
         """
+        return self._verify_keyword(
+            keyword,
+            lambda: self.products_page.verify_all_products_contain(keyword)
+        )
+
+    def _verify_keyword(self, keyword: str, check: Callable[[], bool]) -> bool:
+        """
+        Run a keyword containment check wrapped in step/assertion logging
+
+        Args:
+            keyword: Keyword to verify in product names
+            check: Callable returning True if all products contain the keyword
+
+        Returns:
+            bool: Result of the check
+        """
         Logger.log_step(
             self.logger,
             f"Verifying all search results contain keyword: '{keyword}'"
         )
 
-        result = self.products_page.verify_all_products_contain(keyword)
+        result = check()
 
         if result:
             Logger.log_assertion(
@@ -138,5 +185,5 @@ class SearchSteps:
             int: Number of products displayed
         """
         count = self.products_page.get_product_count()
-        self.logger.info(f"Current product count: {count}")
+        self.logger.info("Current product count: %d", count)
         return count
@@ -1,59 +1,136 @@
 import logging
 import os
+import sys
 from datetime import datetime
+from functools import lru_cache
 
 
-class Logger:
-    """Custom logger class for test framework"""
+# Separator line framing each step banner
+_RULE = "=" * 80
 
-    _loggers = {}
+# Create logs directory and resolve today's log file once per process
+_LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+os.makedirs(_LOGS_DIR, exist_ok=True)
+_LOG_FILE = os.path.join(_LOGS_DIR, f'automation_{datetime.now().strftime("%Y%m%d")}.log')
 
-    @staticmethod
-    def get_logger(name: str = __name__) -> logging.Logger:
+# Formatter shared by every handler
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - [%(levelname)s] - [%(name)s] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Console output goes to stdout and is opt-in under CI/capture (VERBOSE_TEST_LOGS=1);
+# it is never used on pytest-xdist workers, where it is relayed to the controller
+_CONSOLE_ENABLED = not os.getenv("PYTEST_XDIST_WORKER") and (
+    os.getenv("VERBOSE_TEST_LOGS") == "1" or sys.stdout.isatty()
+)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets the file buffer batch writes
+
+    logging.StreamHandler flushes the stream after every record, which
+    costs one write syscall per record. This handler only flushes when a
+    record at or above flush_level is logged, when flush() is called
+    explicitly, or when the buffer fills up.
+    """
+
+    def __init__(self, filename: str, flush_level: int = logging.ERROR,
+                 buffer_size: int = 64 * 1024):
         """
-        Get or create a logger instance
+        Initialize the handler (the file is opened on first write)
 
         Args:
-            name: Logger name (typically __name__)
-
-        Returns:
-            logging.Logger: Configured logger instance
+            filename: Log file path
+            flush_level: Records at or above this level are flushed immediately
+            buffer_size: Size of the file write buffer in bytes
         """
-        if name in Logger._loggers:
-            return Logger._loggers[name]
+        self.flush_level = flush_level
+        self.buffer_size = buffer_size
+        super().__init__(filename, delay=True)
 
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
 
-        # Create logs directory if it doesn't exist
-        logs_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(logs_dir, exist_ok=True)
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record without flushing, unless it is at flush_level
 
-        # File handler
-        log_file = os.path.join(logs_dir, f'automation_{datetime.now().strftime("%Y%m%d")}.log')
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
+        Args:
+            record: Log record to write
+        """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Single file handler shared by every logger (one open file per process).
+# Writes are batched by the file buffer; errors flush immediately.
+_SHARED_FILE_HANDLER = _BufferedFileHandler(_LOG_FILE)
+_SHARED_FILE_HANDLER.setLevel(logging.DEBUG)
+_SHARED_FILE_HANDLER.setFormatter(_FORMATTER)
+
+
+@lru_cache(maxsize=None)
+def _build_logger(name: str) -> logging.Logger:
+    """
+    Create and configure a logger (called once per name)
+
+    Args:
+        name: Logger name
+
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+
+    # Add handlers if not already added
+    if logger.handlers:
+        return logger
 
-        # Console handler
-        console_handler = logging.StreamHandler()
+    logger.addHandler(_SHARED_FILE_HANDLER)
+
+    # Console handler
+    if _CONSOLE_ENABLED:
+        console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_FORMATTER)
+        logger.addHandler(console_handler)
 
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - [%(name)s] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+    return logger
 
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
 
-        # Add handlers if not already added
-        if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+class Logger:
+    """Custom logger class for test framework"""
 
-        Logger._loggers[name] = logger
-        return logger
+    @staticmethod
+    def get_logger(name: str = __name__) -> logging.Logger:
+        """
+        Get or create a logger instance
+
+        Args:
+            name: Logger name (typically __name__)
+
+        Returns:
+            logging.Logger: Configured logger instance
+        """
+        return _build_logger(name)
+
+    @staticmethod
+    def flush() -> None:
+        """Write all buffered file log records to disk"""
+        _SHARED_FILE_HANDLER.flush()
 
     @staticmethod
     def log_step(logger: logging.Logger, step_description: str):
@@ -64,9 +141,7 @@ class Logger:
             logger: Logger instance
             step_description: Description of the step
         """
-        logger.info(f"{'='*80}")
-        logger.info(f"STEP: {step_description}")
-        logger.info(f"{'='*80}")
+        logger.info("\n%s\nSTEP: %s\n%s", _RULE, step_description, _RULE)
 
     @staticmethod
     def log_assertion(logger: logging.Logger, assertion_description: str, result: bool):
@@ -80,4 +155,4 @@ class Logger:
         """
         status = "PASSED" if result else "FAILED"
         log_level = logging.INFO if result else logging.ERROR
-        logger.log(log_level, f"ASSERTION [{status}]: {assertion_description}")
+        logger.log(log_level, "ASSERTION [%s]: %s", status, assertion_description)